@@ -1,11 +1,14 @@
 """FastAPI server for Reflex Docs MCP - deployable to Render."""
 
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Optional
 
 from fastapi import FastAPI, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.reflex_docs_mcp import database
@@ -31,6 +34,20 @@ class HealthResponse(BaseModel):
     stats: Optional[dict] = None
 
 
+# How often free pages left behind by re-indexing are reclaimed
+VACUUM_INTERVAL_SECONDS = 15 * 60
+
+
+async def vacuum_periodically():
+    """Run a small, bounded incremental vacuum on a fixed interval."""
+    while True:
+        await asyncio.sleep(VACUUM_INTERVAL_SECONDS)
+        try:
+            await run_in_threadpool(database.incremental_vacuum)
+        except Exception as e:
+            print(f"⚠️ Incremental vacuum failed: {e}")
+
+
 # Lifespan to initialize database on startup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,8 +56,19 @@ async def lifespan(app: FastAPI):
     database.init_db()
     stats = database.get_stats()
     print(f"✅ Database ready: {stats['pages']} pages, {stats['sections']} sections, {stats['components']} components")
+    # Component names are the most common searches; warming them also
+    # pulls the hottest FTS pages into SQLite's cache
+    components = await run_in_threadpool(database.list_all_components)
+    warmed = await run_in_threadpool(database.warm_search_cache, [c["name"] for c in components])
+    print(f"🔥 Search cache warmed with {warmed} queries")
+    vacuum_task = asyncio.create_task(vacuum_periodically())
     yield
     print("👋 Shutting down...")
+    vacuum_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await vacuum_task
+    database.optimize()
+    database.close_connections()
 
 
 # Create FastAPI app
@@ -48,7 +76,8 @@ app = FastAPI(
     title="Reflex Docs MCP Server",
     description="API server providing structured access to Reflex documentation",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for browser access
@@ -65,7 +94,7 @@ app.add_middleware(
 async def health_check():
     """Health check endpoint."""
     try:
-        stats = database.get_stats()
+        stats = await run_in_threadpool(database.get_stats)
         db_ready = stats.get("sections", 0) > 0
         return HealthResponse(
             status="healthy" if db_ready else "no_data",
@@ -91,12 +120,13 @@ async def search_docs(
     Returns matching sections ranked by relevance.
     """
     try:
-        results = database.search_sections(query, limit=limit)
-        return SearchResponse(
-            query=query,
-            results=[r.model_dump() for r in results],
-            count=len(results)
-        )
+        results = await run_in_threadpool(database.search_sections, query, limit=limit)
+        # Return the response directly to skip re-validating trusted rows
+        return ORJSONResponse({
+            "query": query,
+            "results": results,
+            "count": len(results)
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -108,10 +138,10 @@ async def get_doc(slug: str):
     
     Example: /doc/library/layout/box
     """
-    page = database.get_page_sections(slug)
+    page = await run_in_threadpool(database.get_page_sections, slug)
     if not page:
         raise HTTPException(status_code=404, detail=f"Document not found: {slug}")
-    return page.model_dump()
+    return ORJSONResponse(page.model_dump())
 
 
 @app.get("/components")
@@ -123,12 +153,12 @@ async def list_components(
     
     Optionally filter by category (e.g., 'layout', 'forms').
     """
-    components = database.list_all_components(category=category)
-    return {
+    components = await run_in_threadpool(database.list_all_components, category=category)
+    return ORJSONResponse({
         "category": category,
-        "components": [c.model_dump() for c in components],
+        "components": components,
         "count": len(components)
-    }
+    })
 
 
 @app.get("/component/{name}")
@@ -138,16 +168,16 @@ async def get_component(name: str):
     
     Example: /component/rx.button or /component/button
     """
-    component = database.get_component_by_name(name)
+    component = await run_in_threadpool(database.get_component_by_name, name)
     if not component:
         raise HTTPException(status_code=404, detail=f"Component not found: {name}")
-    return component.model_dump()
+    return ORJSONResponse(component)
 
 
 @app.get("/stats", response_model=StatsResponse)
 async def get_stats():
     """Get database statistics."""
-    stats = database.get_stats()
+    stats = await run_in_threadpool(database.get_stats)
     return StatsResponse(
         pages=stats["pages"],
         sections=stats["sections"],
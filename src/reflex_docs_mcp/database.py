@@ -1,11 +1,17 @@
 """SQLite database operations with FTS5 for full-text search."""
 
+import json
+import re
 import sqlite3
+import threading
+import time
+import weakref
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Generator
+from functools import lru_cache
+from typing import Generator, Iterable
 
-from .models import DocResult, DocSection, DocPage, ComponentInfo
+from .models import DocSection, DocPage
 
 # Default database path
 DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "reflex_docs.db"
@@ -13,6 +19,166 @@ DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "reflex_docs.db
 # Base URL for Reflex docs
 REFLEX_DOCS_BASE_URL = "https://reflex.dev/docs"
 
+# Applied once to every connection when it is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Applied to read-only connections; the journal mode is left to the writer
+READ_ONLY_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Connections are opened once per thread and reused by every helper;
+# each thread keeps one read-write and one read-only connection. Threads are
+# tracked weakly so a worker's connections are closed when the thread exits.
+_local = threading.local()
+_thread_connections: "weakref.WeakSet[_ThreadConnections]" = weakref.WeakSet()
+_connections_lock = threading.Lock()
+
+# Bump when the on-disk schema changes; init_db() migrates older databases
+SCHEMA_VERSION = 4
+
+# Schema versions that introduced a change init_db() must migrate. Databases
+# older than FTS_LAYOUT_VERSION get docs_sections_fts recreated and rebuilt;
+# older than COMPONENTS_FTS_VERSION, components_fts is built from scratch.
+FTS_LAYOUT_VERSION = 4
+COMPONENTS_FTS_VERSION = 3
+
+# Length of the search snippet stored with each section
+SNIPPET_LENGTH = 200
+
+# Maximum number of cached results per read helper
+CACHE_SIZE = 1024
+
+# Search traffic is dominated by a few queries, so it gets a larger dynamic
+# cache plus a static tier pre-warmed at startup. The static tier is never
+# evicted by traffic; only writes that change the data clear it.
+SEARCH_CACHE_SIZE = 4096
+_static_search_cache: dict[tuple[str, int], tuple[sqlite3.Row, ...]] = {}
+
+# Every data write bumps the generation stored in index_state, so a server
+# notices when a separate indexer process has replaced the index and drops
+# its cached results. This is the generation the caches were filled from.
+_index_generation: int | None = None
+
+# Stats are polled by health checks, so they are reused for a few seconds
+STATS_TTL_SECONDS = 5.0
+_stats_cache: tuple[float, dict] | None = None
+
+# Free pages reclaimed per incremental vacuum run
+VACUUM_PAGES = 256
+
+# Plain PRAGMA optimize only looks at tables queried on its own connection,
+# and reads never use the writer connection. The 0x10000 flag (SQLite 3.46+)
+# checks every table instead; older libraries fall back to a full ANALYZE.
+if sqlite3.sqlite_version_info >= (3, 46, 0):
+    _OPTIMIZE_SQL = "PRAGMA optimize=0x10002"
+else:
+    _OPTIMIZE_SQL = "ANALYZE"
+
+# SQLite allows a single writer at a time, so writes are serialized here
+_write_lock = threading.Lock()
+
+# Kept separate so bulk loads can drop and recreate it
+SECTIONS_INSERT_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS docs_sections_ai AFTER INSERT ON docs_sections BEGIN
+        INSERT INTO docs_sections_fts(rowid, title, heading, content, slug, url, snippet)
+        VALUES (new.id, new.title, new.heading, new.content, new.slug, new.url, new.snippet);
+    END
+"""
+
+# Statements are built once here and passed to conn.execute() as-is, so
+# they hit the connection's prepared statement cache on every call
+_INSERT_SECTION_SQL = """
+    INSERT INTO docs_sections (slug, title, heading, level, content, position, url, snippet)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# An upsert rather than INSERT OR REPLACE: REPLACE deletes the old row
+# without firing delete triggers, which would leave stale FTS entries
+_INSERT_COMPONENT_SQL = """
+    INSERT INTO components (name, category, description, doc_slug, url)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        category = excluded.category,
+        description = excluded.description,
+        doc_slug = excluded.doc_slug,
+        url = excluded.url
+"""
+
+# Order by the FTS5 rank column (BM25) so the top-K is taken inside FTS5.
+# Every returned column lives on the FTS table, so search needs no JOIN, and
+# the precomputed snippet means full section content never leaves SQLite.
+# Rowids already returned by an earlier search tier are passed as a JSON
+# array and excluded.
+_SEARCH_SQL = """
+    SELECT 
+        rowid AS id,
+        slug,
+        title,
+        heading,
+        snippet,
+        url,
+        rank
+    FROM docs_sections_fts
+    WHERE docs_sections_fts MATCH ?
+        AND rowid NOT IN (SELECT value FROM json_each(?))
+    ORDER BY rank
+    LIMIT ?
+"""
+
+_PAGE_SQL = """
+    SELECT slug, title, heading, level, content, url
+    FROM docs_sections
+    WHERE slug = ?
+    ORDER BY position
+"""
+
+# Columns are listed explicitly so idx_components_category_name can cover
+# these queries without touching the table
+_COMPONENT_COLUMNS = "name, category, description, doc_slug, url"
+
+_COMPONENTS_SQL = f"SELECT {_COMPONENT_COLUMNS} FROM components ORDER BY name"
+
+_COMPONENTS_BY_CATEGORY_SQL = f"SELECT {_COMPONENT_COLUMNS} FROM components WHERE category = ? ORDER BY name"
+
+# Matches either spelling of the name in one lookup on idx_components_name
+_COMPONENT_SQL = f"SELECT {_COMPONENT_COLUMNS} FROM components WHERE name COLLATE NOCASE IN (?, ?) LIMIT 1"
+
+# Fallback for partial names, answered from the components_fts prefix indexes
+_COMPONENT_PREFIX_SQL = """
+    SELECT c.name, c.category, c.description, c.doc_slug, c.url
+    FROM components_fts f
+    JOIN components c ON f.rowid = c.id
+    WHERE components_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT 1
+"""
+
+# The prefix fallback needs a run of this many letters or digits (a token
+# the FTS5 tokenizer keeps); shorter names match too many components
+MIN_PREFIX_LENGTH = 2
+_PREFIX_TOKEN_RE = re.compile(rf"[^\W_]{{{MIN_PREFIX_LENGTH}}}")
+
+_BUMP_GENERATION_SQL = "UPDATE index_state SET generation = generation + 1"
+
+_GENERATION_SQL = "SELECT generation FROM index_state"
+
+_STATS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM docs_sections) AS sections,
+        (SELECT COUNT(DISTINCT slug) FROM docs_sections) AS pages,
+        (SELECT COUNT(*) FROM components) AS components
+"""
+
 
 def get_db_path() -> Path:
     """Get the database path, creating parent directories if needed."""
@@ -21,22 +187,113 @@ def get_db_path() -> Path:
     return db_path
 
 
-@contextmanager
-def get_connection() -> Generator[sqlite3.Connection, None, None]:
-    """Get a database connection with row factory."""
-    conn = sqlite3.connect(get_db_path())
+def _open_connection() -> sqlite3.Connection:
+    """Open a new connection with row factory and tuned PRAGMAs."""
+    conn = sqlite3.connect(get_db_path(), check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _open_ro_connection() -> sqlite3.Connection:
+    """Open a new read-only connection with row factory and tuned PRAGMAs."""
+    uri = f"{get_db_path().resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    for pragma in READ_ONLY_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _close_all(connections: dict[str, sqlite3.Connection]) -> None:
+    """Close and forget every connection in ``connections``."""
+    for conn in connections.values():
         conn.close()
+    connections.clear()
+
+
+class _ThreadConnections:
+    """The connections opened by one thread, closed when the thread exits."""
+
+    def __init__(self) -> None:
+        self.connections: dict[str, sqlite3.Connection] = {}
+        # The finalizer must not reference self, or it would never run
+        weakref.finalize(self, _close_all, self.connections)
+
+
+def _thread_connection(name: str, open_connection) -> sqlite3.Connection:
+    """Get the current thread's connection stored under ``name``."""
+    holder = getattr(_local, "holder", None)
+    if holder is None:
+        holder = _local.holder = _ThreadConnections()
+        with _connections_lock:
+            _thread_connections.add(holder)
+    
+    conn = holder.connections.get(name)
+    if conn is None:
+        conn = holder.connections[name] = open_connection()
+    return conn
+
+
+def get_connection() -> sqlite3.Connection:
+    """Get the current thread's shared connection, opening it on first use."""
+    return _thread_connection("conn", _open_connection)
+
+
+def get_ro_connection() -> sqlite3.Connection:
+    """Get the current thread's read-only connection, used by all queries."""
+    return _thread_connection("ro_conn", _open_ro_connection)
+
+
+def close_connections() -> None:
+    """Close every shared connection (called on shutdown)."""
+    with _connections_lock:
+        holders = list(_thread_connections)
+    for holder in holders:
+        _close_all(holder.connections)
+
+
+@contextmanager
+def write_transaction(clear_caches: bool = True) -> Generator[sqlite3.Connection, None, None]:
+    """Run a write on the shared connection, committing on success.
+    
+    Cached read results are dropped once the write completes, unless
+    ``clear_caches`` is False for maintenance that leaves the data unchanged.
+    """
+    global _index_generation
+    conn = get_connection()
+    with _write_lock:
+        with conn:
+            yield conn
+            if clear_caches:
+                conn.execute(_BUMP_GENERATION_SQL)
+                generation = conn.execute(_GENERATION_SQL).fetchone()[0]
+        if clear_caches:
+            _clear_caches()
+            _index_generation = generation
 
 
 def init_db() -> None:
     """Initialize the database with required tables."""
-    with get_connection() as conn:
+    with write_transaction() as conn:
         cursor = conn.cursor()
         
+        # Incremental auto-vacuum only applies if set before any table exists;
+        # databases created without it need one full VACUUM to switch over
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        if cursor.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            cursor.execute("VACUUM")
+        
+        # Drop an FTS index with an older layout and its triggers so they are
+        # recreated below and rebuilt from docs_sections
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version < FTS_LAYOUT_VERSION:
+            cursor.execute("DROP TRIGGER IF EXISTS docs_sections_ai")
+            cursor.execute("DROP TRIGGER IF EXISTS docs_sections_ad")
+            cursor.execute("DROP TRIGGER IF EXISTS docs_sections_au")
+            cursor.execute("DROP TABLE IF EXISTS docs_sections_fts")
+        
         # Main sections table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS docs_sections (
@@ -47,43 +304,58 @@ def init_db() -> None:
                 level INTEGER NOT NULL,
                 content TEXT NOT NULL,
                 position INTEGER NOT NULL,
-                url TEXT NOT NULL
+                url TEXT NOT NULL,
+                snippet TEXT NOT NULL DEFAULT ''
             )
         """)
         
-        # FTS5 virtual table for full-text search
+        # Schema version 2 added the precomputed snippet column
+        columns = {row["name"] for row in cursor.execute("PRAGMA table_info(docs_sections)")}
+        if "snippet" not in columns:
+            cursor.execute("ALTER TABLE docs_sections ADD COLUMN snippet TEXT NOT NULL DEFAULT ''")
+            cursor.executemany(
+                "UPDATE docs_sections SET snippet = ? WHERE id = ?",
+                [
+                    (make_snippet(row["content"]), row["id"])
+                    for row in cursor.execute("SELECT id, content FROM docs_sections").fetchall()
+                ]
+            )
+        
+        # FTS5 virtual table for full-text search. The slug, URL and snippet
+        # are not prose, so they are UNINDEXED: stored for search results but
+        # kept out of the index. Porter stemming improves recall on English
+        # docs. Full detail is kept because exact phrase search needs token
+        # positions.
         cursor.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS docs_sections_fts USING fts5(
-                slug,
                 title,
                 heading,
                 content,
+                slug UNINDEXED,
+                url UNINDEXED,
+                snippet UNINDEXED,
                 content='docs_sections',
-                content_rowid='id'
+                content_rowid='id',
+                tokenize='porter unicode61'
             )
         """)
         
         # Triggers to keep FTS in sync
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS docs_sections_ai AFTER INSERT ON docs_sections BEGIN
-                INSERT INTO docs_sections_fts(rowid, slug, title, heading, content)
-                VALUES (new.id, new.slug, new.title, new.heading, new.content);
-            END
-        """)
+        cursor.execute(SECTIONS_INSERT_TRIGGER)
         
         cursor.execute("""
             CREATE TRIGGER IF NOT EXISTS docs_sections_ad AFTER DELETE ON docs_sections BEGIN
-                INSERT INTO docs_sections_fts(docs_sections_fts, rowid, slug, title, heading, content)
-                VALUES ('delete', old.id, old.slug, old.title, old.heading, old.content);
+                INSERT INTO docs_sections_fts(docs_sections_fts, rowid, title, heading, content, slug, url, snippet)
+                VALUES ('delete', old.id, old.title, old.heading, old.content, old.slug, old.url, old.snippet);
             END
         """)
         
         cursor.execute("""
             CREATE TRIGGER IF NOT EXISTS docs_sections_au AFTER UPDATE ON docs_sections BEGIN
-                INSERT INTO docs_sections_fts(docs_sections_fts, rowid, slug, title, heading, content)
-                VALUES ('delete', old.id, old.slug, old.title, old.heading, old.content);
-                INSERT INTO docs_sections_fts(rowid, slug, title, heading, content)
-                VALUES (new.id, new.slug, new.title, new.heading, new.content);
+                INSERT INTO docs_sections_fts(docs_sections_fts, rowid, title, heading, content, slug, url, snippet)
+                VALUES ('delete', old.id, old.title, old.heading, old.content, old.slug, old.url, old.snippet);
+                INSERT INTO docs_sections_fts(rowid, title, heading, content, slug, url, snippet)
+                VALUES (new.id, new.title, new.heading, new.content, new.slug, new.url, new.snippet);
             END
         """)
         
@@ -99,20 +371,91 @@ def init_db() -> None:
             )
         """)
         
+        # Single-row counter of data writes, read by _sync_caches()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS index_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                generation INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("INSERT OR IGNORE INTO index_state (id, generation) VALUES (1, 0)")
+        
+        # FTS5 table over component names with prefix indexes, so partial
+        # names like "butt" are matched by index lookup instead of a LIKE scan
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS components_fts USING fts5(
+                name,
+                description,
+                content='components',
+                content_rowid='id',
+                prefix='2 3 4'
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS components_ai AFTER INSERT ON components BEGIN
+                INSERT INTO components_fts(rowid, name, description)
+                VALUES (new.id, new.name, new.description);
+            END
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS components_ad AFTER DELETE ON components BEGIN
+                INSERT INTO components_fts(components_fts, rowid, name, description)
+                VALUES ('delete', old.id, old.name, old.description);
+            END
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS components_au AFTER UPDATE ON components BEGIN
+                INSERT INTO components_fts(components_fts, rowid, name, description)
+                VALUES ('delete', old.id, old.name, old.description);
+                INSERT INTO components_fts(rowid, name, description)
+                VALUES (new.id, new.name, new.description);
+            END
+        """)
+        
         # Indexes for faster queries
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sections_slug ON docs_sections(slug)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_components_category ON components(category)")
+        # (slug, position) serves page lookups in output order without a sort
+        # and makes the old slug-only index redundant
+        cursor.execute("DROP INDEX IF EXISTS idx_sections_slug")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sections_slug_pos ON docs_sections(slug, position)")
+        # SQLite has no INCLUDE clause, so the remaining columns are appended
+        # to make this a covering index; it replaces the category-only index
+        cursor.execute("DROP INDEX IF EXISTS idx_components_category")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_components_category_name
+            ON components(category, name, description, doc_slug, url)
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_components_name ON components(name COLLATE NOCASE)")
+        
+        if version < FTS_LAYOUT_VERSION:
+            cursor.execute("INSERT INTO docs_sections_fts(docs_sections_fts) VALUES ('rebuild')")
+        if version < COMPONENTS_FTS_VERSION:
+            cursor.execute("INSERT INTO components_fts(components_fts) VALUES ('rebuild')")
+        if version < SCHEMA_VERSION:
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         
-        conn.commit()
+        # Refresh planner statistics so the indexes above are picked up
+        cursor.execute("ANALYZE")
+
+
+def make_snippet(content: str) -> str:
+    """Build the search snippet for a section: its opening text on one line."""
+    text = " ".join(content.split())
+    return text[:SNIPPET_LENGTH] + ("…" if len(text) > SNIPPET_LENGTH else "")
 
 
 def clear_db() -> None:
     """Clear all data from the database (for re-indexing)."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM docs_sections")
-        cursor.execute("DELETE FROM components")
-        conn.commit()
+    with write_transaction() as conn:
+        _delete_all(conn)
+
+
+def _delete_all(conn: sqlite3.Connection) -> None:
+    """Delete every section and component inside the caller's transaction."""
+    conn.execute("DELETE FROM docs_sections")
+    conn.execute("DELETE FROM components")
 
 
 def insert_section(
@@ -125,16 +468,11 @@ def insert_section(
     url: str
 ) -> None:
     """Insert a documentation section."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO docs_sections (slug, title, heading, level, content, position, url)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (slug, title, heading, level, content, position, url)
+    with write_transaction() as conn:
+        conn.execute(
+            _INSERT_SECTION_SQL,
+            (slug, title, heading, level, content, position, url, make_snippet(content))
         )
-        conn.commit()
 
 
 def insert_component(
@@ -145,178 +483,314 @@ def insert_component(
     url: str | None
 ) -> None:
     """Insert a component, updating if it already exists."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO components (name, category, description, doc_slug, url)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+    with write_transaction() as conn:
+        conn.execute(
+            _INSERT_COMPONENT_SQL,
             (name, category, description, doc_slug, url)
         )
-        conn.commit()
 
 
-def search_sections(query: str, limit: int = 10) -> list[DocResult]:
-    """Search docs sections using FTS5."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Escape special FTS5 characters by wrapping terms in quotes
-        # FTS5 treats . : - and other chars as syntax
-        # We split on whitespace and quote each term
-        terms = query.strip().split()
-        if not terms:
-            return []
-        
-        # Quote each term to escape special characters
-        escaped_query = " ".join(f'"{term}"' for term in terms)
-        
-        # Use BM25 for ranking
-        cursor.execute(
-            """
-            SELECT 
-                s.slug,
-                s.title,
-                s.heading,
-                s.content,
-                s.url,
-                bm25(docs_sections_fts) as score
-            FROM docs_sections_fts fts
-            JOIN docs_sections s ON fts.rowid = s.id
-            WHERE docs_sections_fts MATCH ?
-            ORDER BY score
-            LIMIT ?
-            """,
-            (escaped_query, limit)
-        )
-        
-        results = []
-        for row in cursor.fetchall():
-            # Create a snippet from content (first 200 chars)
-            content = row["content"]
-            snippet = content[:200] + "..." if len(content) > 200 else content
-            
-            results.append(DocResult(
-                slug=row["slug"],
-                title=row["title"],
-                score=abs(row["score"]),  # BM25 returns negative scores
-                snippet=snippet,
-                url=row["url"]
-            ))
-        
-        return results
+def insert_sections_bulk(rows: list[tuple]) -> None:
+    """Insert many documentation sections in a single transaction.
+    
+    Args:
+        rows: Tuples of (slug, title, heading, level, content, position, url)
+    """
+    if not rows:
+        return
+    
+    with write_transaction() as conn:
+        conn.execute("BEGIN")
+        _insert_sections(conn, rows)
+
+
+def _insert_sections(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    """Insert sections inside the caller's transaction."""
+    if not rows:
+        return
+    
+    last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM docs_sections").fetchone()[0]
+    
+    # Skip the per-row FTS trigger and index the new rows in one pass
+    conn.execute("DROP TRIGGER IF EXISTS docs_sections_ai")
+    conn.executemany(
+        _INSERT_SECTION_SQL,
+        [(*row, make_snippet(row[4])) for row in rows]
+    )
+    conn.execute(
+        """
+        INSERT INTO docs_sections_fts(rowid, title, heading, content, slug, url, snippet)
+        SELECT id, title, heading, content, slug, url, snippet FROM docs_sections WHERE id > ?
+        """,
+        (last_id,)
+    )
+    conn.execute(SECTIONS_INSERT_TRIGGER)
+
+
+def insert_components_bulk(rows: list[tuple]) -> None:
+    """Insert many components in a single transaction, updating existing ones.
+    
+    Args:
+        rows: Tuples of (name, category, description, doc_slug, url)
+    """
+    if not rows:
+        return
+    
+    with write_transaction() as conn:
+        conn.execute("BEGIN")
+        conn.executemany(_INSERT_COMPONENT_SQL, rows)
+
+
+def replace_index(
+    section_rows: list[tuple],
+    component_rows: list[tuple],
+    clear_existing: bool = True
+) -> None:
+    """Write a freshly parsed index in a single transaction.
+    
+    Readers keep seeing the old index until the commit and then switch to
+    the new one at once, never an empty or half-written index.
+    
+    Args:
+        section_rows: Tuples of (slug, title, heading, level, content, position, url)
+        component_rows: Tuples of (name, category, description, doc_slug, url)
+        clear_existing: If True, delete the old sections and components first
+    """
+    with write_transaction() as conn:
+        conn.execute("BEGIN")
+        if clear_existing:
+            _delete_all(conn)
+        _insert_sections(conn, section_rows)
+        if component_rows:
+            conn.executemany(_INSERT_COMPONENT_SQL, component_rows)
+
+
+def incremental_vacuum(pages: int = VACUUM_PAGES) -> None:
+    """Return up to ``pages`` free pages to the filesystem."""
+    # Only free pages move, so cached results stay valid
+    with write_transaction(clear_caches=False) as conn:
+        # executescript() steps the PRAGMA to completion; execute() would
+        # only free a single page
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+
+
+def analyze() -> None:
+    """Refresh query planner statistics after a bulk load."""
+    with write_transaction(clear_caches=False) as conn:
+        conn.execute("ANALYZE docs_sections")
+        conn.execute("ANALYZE components")
+
+
+def optimize() -> None:
+    """Let SQLite update planner statistics it considers stale (run before closing)."""
+    with write_transaction(clear_caches=False) as conn:
+        conn.execute(_OPTIMIZE_SQL)
+
+
+def search_sections(query: str, limit: int = 10) -> list[dict]:
+    """Search docs sections using FTS5.
+    
+    Returns plain dicts with the fields of ``DocResult`` so the hot path
+    skips pydantic model construction and re-serialization.
+    """
+    # Blank queries return before any cache or connection work
+    query = _normalize_query(query)
+    if not query:
+        return []
+    
+    _sync_caches()
+    rows = _static_search_cache.get((query, limit))
+    if rows is None:
+        rows = _search_rows(query, limit)
+    
+    return [
+        {
+            "slug": row["slug"],
+            "title": row["title"],
+            "score": abs(row["rank"]),  # BM25 returns negative scores
+            "snippet": row["snippet"],
+            "url": row["url"]
+        }
+        for row in rows
+    ]
+
+
+def warm_search_cache(queries: Iterable[str], limit: int = 10) -> int:
+    """Pre-compute results for known popular queries into the static cache.
+    
+    Returns:
+        Number of distinct queries cached
+    """
+    _sync_caches()
+    for query in queries:
+        query = _normalize_query(query)
+        if query and (query, limit) not in _static_search_cache:
+            # Bypass the dynamic cache so warming does not evict its entries
+            _static_search_cache[(query, limit)] = _search_rows.__wrapped__(query, limit)
+    return len(_static_search_cache)
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a search query into its cache key."""
+    # FTS5 matching is case-insensitive and ignores extra whitespace. Term
+    # order is kept because the exact phrase tier depends on it.
+    return " ".join(query.lower().split())
+
+
+@lru_cache(maxsize=SEARCH_CACHE_SIZE)
+def _search_rows(query: str, limit: int) -> tuple[sqlite3.Row, ...]:
+    """Run the FTS5 search query, caching the raw rows.
+    
+    Exact phrase matches are returned first; any remaining slots are
+    filled with BM25-ranked matches on the individual terms.
+    """
+    # Escape special FTS5 characters by wrapping terms in quotes
+    # FTS5 treats . : - and other chars as syntax
+    # We split on whitespace and quote each term; quotes inside a term are
+    # doubled, which is how FTS5 escapes them within a string
+    terms = query.replace('"', '""').split()
+    conn = get_ro_connection()
+    
+    # Tier 1: the whole query as an exact phrase
+    phrase_query = '"' + " ".join(terms) + '"'
+    rows = conn.execute(_SEARCH_SQL, (phrase_query, "[]", limit)).fetchall()
+    
+    # Tier 2: the individual terms, skipping sections already returned.
+    # A single-term phrase is the same query, so there is nothing to add.
+    if len(terms) > 1 and len(rows) < limit:
+        escaped_query = '"' + '" "'.join(terms) + '"'
+        seen_ids = json.dumps([row["id"] for row in rows])
+        rows += conn.execute(_SEARCH_SQL, (escaped_query, seen_ids, limit - len(rows))).fetchall()
+    
+    return tuple(rows)
 
 
 def get_page_sections(slug: str) -> DocPage | None:
     """Get all sections for a documentation page."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT slug, title, heading, level, content, url
-            FROM docs_sections
-            WHERE slug = ?
-            ORDER BY position
-            """,
-            (slug,)
-        )
-        
-        rows = cursor.fetchall()
-        if not rows:
-            return None
-        
-        sections = [
-            DocSection(
-                heading=row["heading"],
-                level=row["level"],
-                content=row["content"]
-            )
-            for row in rows
-        ]
-        
-        return DocPage(
-            slug=rows[0]["slug"],
-            title=rows[0]["title"],
-            url=rows[0]["url"],
-            sections=sections
+    _sync_caches()
+    rows = _page_rows(slug)
+    if not rows:
+        return None
+    
+    sections = [
+        DocSection(
+            heading=row["heading"],
+            level=row["level"],
+            content=row["content"]
         )
+        for row in rows
+    ]
+    
+    return DocPage(
+        slug=rows[0]["slug"],
+        title=rows[0]["title"],
+        url=rows[0]["url"],
+        sections=sections
+    )
 
 
-def list_all_components(category: str | None = None) -> list[ComponentInfo]:
-    """List all components, optionally filtered by category."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        if category:
-            cursor.execute(
-                "SELECT * FROM components WHERE category = ? ORDER BY name",
-                (category,)
-            )
-        else:
-            cursor.execute("SELECT * FROM components ORDER BY name")
-        
-        return [
-            ComponentInfo(
-                name=row["name"],
-                category=row["category"],
-                description=row["description"],
-                doc_slug=row["doc_slug"],
-                url=row["url"]
-            )
-            for row in cursor.fetchall()
-        ]
+@lru_cache(maxsize=CACHE_SIZE)
+def _page_rows(slug: str) -> tuple[sqlite3.Row, ...]:
+    """Fetch the ordered sections of a page, caching the raw rows."""
+    conn = get_ro_connection()
+    return tuple(conn.execute(_PAGE_SQL, (slug,)).fetchall())
+
+
+def list_all_components(category: str | None = None) -> list[dict]:
+    """List all components, optionally filtered by category.
+    
+    Returns plain dicts with the fields of ``ComponentInfo``.
+    """
+    conn = get_ro_connection()
+    if category:
+        rows = conn.execute(_COMPONENTS_BY_CATEGORY_SQL, (category,)).fetchall()
+    else:
+        rows = conn.execute(_COMPONENTS_SQL).fetchall()
+    
+    return [_component_dict(row) for row in rows]
 
 
-def get_component_by_name(name: str) -> ComponentInfo | None:
-    """Get a component by its name."""
+def get_component_by_name(name: str) -> dict | None:
+    """Get a component by its name, as a dict with the ``ComponentInfo`` fields."""
+    _sync_caches()
+    row = _component_row(name)
+    if not row:
+        return None
+    
+    return _component_dict(row)
+
+
+def _component_dict(row: sqlite3.Row) -> dict:
+    """Convert a components row to a dict ready for JSON serialization."""
+    # Component queries select exactly the ComponentInfo columns
+    return dict(row)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _component_row(name: str) -> sqlite3.Row | None:
+    """Look up a component row by name, caching the result.
+    
+    Falls back to the best prefix match on the name (e.g. "butt" finds
+    rx.button) when there is no exact match.
+    """
     # Normalize name - accept with or without rx. prefix
-    search_name = name if name.startswith("rx.") else f"rx.{name}"
+    bare_name = name.removeprefix("rx.")
     
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM components WHERE name = ?",
-            (search_name,)
-        )
-        
-        row = cursor.fetchone()
-        if not row:
-            # Try without prefix
-            cursor.execute(
-                "SELECT * FROM components WHERE name = ?",
-                (name.replace("rx.", ""),)
-            )
-            row = cursor.fetchone()
-        
-        if not row:
-            return None
-        
-        return ComponentInfo(
-            name=row["name"],
-            category=row["category"],
-            description=row["description"],
-            doc_slug=row["doc_slug"],
-            url=row["url"]
-        )
+    conn = get_ro_connection()
+    row = conn.execute(_COMPONENT_SQL, (f"rx.{bare_name}", bare_name)).fetchone()
+    if row or not _PREFIX_TOKEN_RE.search(bare_name):
+        return row
+    
+    # Every indexed name starts with the "rx" token, so anchor the phrase on
+    # it at the start of the name column; otherwise "r" or "rx" would match
+    # any component. Quotes are doubled to keep the FTS5 phrase intact.
+    prefix_query = 'name: ^"rx ' + bare_name.replace('"', '""') + '"*'
+    return conn.execute(_COMPONENT_PREFIX_SQL, (prefix_query,)).fetchone()
+
+
+def _clear_caches() -> None:
+    """Drop cached query results so reads see the latest writes."""
+    global _stats_cache
+    _stats_cache = None
+    _static_search_cache.clear()
+    _search_rows.cache_clear()
+    _page_rows.cache_clear()
+    _component_row.cache_clear()
+
+
+def _sync_caches() -> None:
+    """Drop cached query results if another process changed the data."""
+    global _index_generation
+    conn = get_ro_connection()
+    # data_version changes whenever another connection commits, including
+    # maintenance that leaves the data alone, so it only triggers a read of
+    # the generation counter, which decides whether the caches are stale.
+    # The value is per connection, so it is remembered with its connection.
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    if getattr(_local, "data_version", None) == (conn, data_version):
+        return
+    
+    _local.data_version = (conn, data_version)
+    generation = conn.execute(_GENERATION_SQL).fetchone()[0]
+    if generation != _index_generation:
+        _clear_caches()
+        _index_generation = generation
 
 
 def get_stats() -> dict:
     """Get database statistics."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) as count FROM docs_sections")
-        sections_count = cursor.fetchone()["count"]
-        
-        cursor.execute("SELECT COUNT(DISTINCT slug) as count FROM docs_sections")
-        pages_count = cursor.fetchone()["count"]
-        
-        cursor.execute("SELECT COUNT(*) as count FROM components")
-        components_count = cursor.fetchone()["count"]
-        
-        return {
-            "sections": sections_count,
-            "pages": pages_count,
-            "components": components_count
-        }
+    global _stats_cache
+    now = time.monotonic()
+    if _stats_cache and now - _stats_cache[0] < STATS_TTL_SECONDS:
+        return dict(_stats_cache[1])
+    
+    conn = get_ro_connection()
+    row = conn.execute(_STATS_SQL).fetchone()
+    stats = {
+        "sections": row["sections"],
+        "pages": row["pages"],
+        "components": row["components"]
+    }
+    
+    _stats_cache = (now, stats)
+    return dict(stats)
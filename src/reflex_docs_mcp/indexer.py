@@ -86,11 +86,8 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
     """
     logger.info(f"Indexing docs from {docs_dir}")
     
-    # Initialize and optionally clear database
+    # Initialize database; the old index is replaced once parsing is done
     database.init_db()
-    if clear_existing:
-        logger.info("Clearing existing index")
-        database.clear_db()
     
     stats = {
         "files_processed": 0,
@@ -103,6 +100,11 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
     md_files = list(docs_dir.rglob("*.md"))
     logger.info(f"Found {len(md_files)} markdown files")
     
+    # Rows are collected here and written in one transaction at the end, so
+    # a running server keeps serving the old index until the new one commits
+    section_rows = []
+    component_rows = []
+    
     for file_path in md_files:
         try:
             # Skip __init__.py and non-doc files
@@ -114,15 +116,15 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
             
             # Index all sections
             for section in parsed.sections:
-                database.insert_section(
-                    slug=parsed.slug,
-                    title=parsed.title,
-                    heading=section.heading,
-                    level=section.level,
-                    content=section.content,
-                    position=section.position,
-                    url=parsed.url
-                )
+                section_rows.append((
+                    parsed.slug,
+                    parsed.title,
+                    section.heading,
+                    section.level,
+                    section.content,
+                    section.position,
+                    parsed.url
+                ))
                 stats["sections_indexed"] += 1
             
             # Index components from frontmatter
@@ -134,13 +136,13 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
                 category = get_category_from_slug(parsed.slug)
                 description = extract_component_description(parsed)
                 
-                database.insert_component(
-                    name=component_name,
-                    category=category,
-                    description=description,
-                    doc_slug=parsed.slug,
-                    url=parsed.url
-                )
+                component_rows.append((
+                    component_name,
+                    category,
+                    description,
+                    parsed.slug,
+                    parsed.url
+                ))
                 stats["components_indexed"] += 1
             
             stats["files_processed"] += 1
@@ -152,6 +154,12 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
             logger.error(f"Error processing {file_path}: {e}")
             stats["errors"] += 1
     
+    if clear_existing:
+        logger.info("Replacing existing index")
+    logger.info(f"Writing {len(section_rows)} sections and {len(component_rows)} components")
+    database.replace_index(section_rows, component_rows, clear_existing)
+    database.analyze()
+    
     logger.info(f"Indexing complete: {stats}")
     return stats
 
@@ -50,8 +50,7 @@ def search_docs(query: str, limit: int = 10) -> list[dict]:
     logger.info(f"Searching docs: {query}")
     
     try:
-        results = database.search_sections(query, limit=limit)
-        return [result.model_dump() for result in results]
+        return database.search_sections(query, limit=limit)
     except Exception as e:
         logger.error(f"Search error: {e}")
         return []
@@ -101,8 +100,7 @@ def list_components(category: str | None = None) -> list[dict]:
     logger.info(f"Listing components (category: {category})")
     
     try:
-        components = database.list_all_components(category=category)
-        return [comp.model_dump() for comp in components]
+        return database.list_all_components(category=category)
     except Exception as e:
         logger.error(f"List components error: {e}")
         return []
@@ -114,7 +112,8 @@ def get_component(name: str) -> dict | None:
     
     Args:
         name: Component name (e.g., "rx.box", "rx.button", "box", "button")
-              The "rx." prefix is optional.
+              The "rx." prefix is optional, and a partial name of at
+              least two characters returns the closest prefix match.
     
     Returns:
         Component info with name, category, description, and documentation URL
@@ -126,10 +125,7 @@ def get_component(name: str) -> dict | None:
     logger.info(f"Getting component: {name}")
     
     try:
-        component = database.get_component_by_name(name)
-        if component:
-            return component.model_dump()
-        return None
+        return database.get_component_by_name(name)
     except Exception as e:
         logger.error(f"Get component error: {e}")
         return None
@@ -204,10 +200,14 @@ def main():
     # Run the server
     logger.info(f"Starting Reflex Docs MCP Server ({args.transport})")
     
-    if args.transport == "stdio":
-        mcp.run()
-    else:
-        mcp.run(transport="sse", host=args.host, port=args.port)
+    try:
+        if args.transport == "stdio":
+            mcp.run()
+        else:
+            mcp.run(transport="sse", host=args.host, port=args.port)
+    finally:
+        database.optimize()
+        database.close_connections()
 
 
 if __name__ == "__main__":